@@ -0,0 +1,48 @@
+"""
+Throughput benchmark for pre-trade risk checks on the card-sum market.
+Run with: python benchmarks/risk.py [--trades N] [--clients N] [--min-rate R]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market_maker.market_maker import MarketMaker
+from market_maker.risk import RiskEngine, RiskLimits
+from market_maker.rng import RandomService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Risk engine checks/sec benchmark")
+    parser.add_argument("--trades", type=int, default=200000)
+    parser.add_argument("--clients", type=int, default=10000)
+    parser.add_argument("--min-rate", type=float, default=1e5)
+    args = parser.parse_args()
+
+    rng = RandomService(seed=0)
+    market_maker = MarketMaker(rng.spawn())
+    market_maker.set_risk_engine(RiskEngine(RiskLimits(max_position=50, max_notional=2000, max_loss=500,
+                                                       max_total_position=10 ** 6, client_kill_loss=1000)))
+    orders = [(rng.randint(0, args.clients - 1), rng.randint(1, 5), rng.random() < 0.5)
+              for _ in range(args.trades)]
+
+    start = time.perf_counter()
+    for i, (client, amount, is_buy) in enumerate(orders):
+        market_maker.place_trade(amount, is_buy, client)
+        if i % 1000 == 999:
+            market_maker.update_prices(0)
+    elapsed = time.perf_counter() - start
+
+    rate = args.trades / elapsed
+    print(f"{rate:,.0f} checked trades/sec over {args.trades} trades "
+          f"and {args.clients} clients (minimum {args.min_rate:,.0f})")
+    if rate < args.min_rate:
+        print("FAIL: risk check throughput below minimum")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
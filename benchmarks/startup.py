@@ -0,0 +1,55 @@
+"""
+Startup benchmark for the engine import path.
+Run with: python benchmarks/startup.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Imports the engine and plays one round of each game in a fresh interpreter.
+# Unseeded games must not load NumPy.
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+from market_maker.games import DiceGame, PokerGame, CoinGame
+for game_cls in (DiceGame, PokerGame, CoinGame):
+    game_cls().play_round()
+elapsed = time.perf_counter() - start
+assert "tkinter" not in sys.modules, "engine import pulled in tkinter"
+assert "numpy" not in sys.modules, "unseeded games pulled in numpy"
+print(elapsed)
+"""
+
+
+def measure(runs: int) -> list:
+    """Return engine startup times in milliseconds, one per fresh process"""
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", SNIPPET], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        timings.append(float(output) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Engine import/startup time benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    timings = measure(args.runs)
+    median = statistics.median(timings)
+    print(f"engine startup: median {median:.2f} ms, min {min(timings):.2f} ms, "
+          f"max {max(timings):.2f} ms over {args.runs} runs (budget {args.budget_ms:.2f} ms)")
+    if median > args.budget_ms:
+        print("FAIL: startup budget exceeded")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional, Sequence
+import numpy as np
+from .ring_buffer import RingBuffer, minmax_decimate
+
+# (label, plot, color) for each series pushed to the chart, in push order
+SERIES = [
+    ("Balance", 0, "black"),
+    ("Dice PnL", 1, "blue"),
+    ("Poker PnL", 1, "red"),
+    ("Coin PnL", 1, "green"),
+    ("Bid", 2, "orange"),
+    ("Ask", 2, "purple"),
+    ("Card sum", 2, "gray"),
+]
+PLOT_TITLES = ["Balance", "PnL by game", "Poker quotes vs card sum"]
+
+
+class ChartPanel(ttk.LabelFrame):
+    """
+    Live chart of balance, per-game PnL and poker quotes.
+
+    Samples go into a ring buffer and are drawn on a timer. Each pixel column
+    shows the min/max of a bucket of samples, and new buckets are appended as
+    line segments. The canvas is only cleared when the chart runs out of width
+    (buckets then double in size, up to the ring buffer capacity) or when a
+    value leaves the current vertical range.
+    """
+
+    def __init__(self, parent, width: int = 600, plot_height: int = 80,
+                 capacity: int = 100000, frame_ms: int = 33):
+        super().__init__(parent, text="Chart", padding="5")
+        self.width = width
+        self.plot_height = plot_height
+        self.frame_ms = frame_ms
+        self.buffer = RingBuffer(len(SERIES), capacity)
+        self.max_bucket = max(1, capacity // width)
+        self.bucket_size = 1
+        self.start = 0    # Sample drawn at x = 0
+        self.drawn = 0    # Samples drawn so far
+        self.ranges = [(0.0, 1.0)] * len(PLOT_TITLES)
+        self.last: Optional[np.ndarray] = None  # Last drawn sample of each series
+
+        self.canvas = tk.Canvas(self, width=width, height=plot_height * len(PLOT_TITLES), background="white")
+        self.canvas.grid(row=0, column=0)
+        for plot, title in enumerate(PLOT_TITLES):
+            top = plot * plot_height
+            self.canvas.create_line(0, top, width, top, fill="lightgray")
+            self.canvas.create_text(4, top + 2, text=title, anchor="nw", fill="gray")
+
+        legend = ttk.Frame(self)
+        legend.grid(row=1, column=0, sticky="w")
+        for i, (label, _, color) in enumerate(SERIES):
+            tk.Label(legend, text=label, foreground=color).grid(row=0, column=i, padx=3)
+
+        self.after(self.frame_ms, self._tick)
+
+    def push(self, values: Sequence[float]) -> None:
+        """Add one sample per series, in SERIES order"""
+        self.buffer.append(values)
+
+    def _tick(self) -> None:
+        self._draw_new()
+        self.after(self.frame_ms, self._tick)
+
+    def _y(self, plot: int, value: np.ndarray) -> np.ndarray:
+        lo, hi = self.ranges[plot]
+        inner = self.plot_height - 16
+        return plot * self.plot_height + 14 + (hi - value) / (hi - lo) * inner
+
+    def _fits(self, lows: np.ndarray, highs: np.ndarray) -> bool:
+        return all(lows[i].min() >= self.ranges[plot][0] and highs[i].max() <= self.ranges[plot][1]
+                   for i, (_, plot, _) in enumerate(SERIES))
+
+    def _draw_new(self) -> None:
+        buckets = (self.buffer.total - self.drawn) // self.bucket_size
+        if buckets == 0:
+            return
+        x = (self.drawn - self.start) // self.bucket_size
+        if x + buckets > self.width or self.drawn < self.buffer.total - self.buffer.capacity:
+            self._redraw()
+            return
+        samples = self.buffer.window(self.drawn, self.drawn + buckets * self.bucket_size)
+        lows, highs = minmax_decimate(samples, self.bucket_size)
+        if not self._fits(lows, highs):
+            self._redraw()
+            return
+        self._draw_buckets(x, samples, lows, highs)
+        self.drawn += buckets * self.bucket_size
+
+    def _redraw(self) -> None:
+        """Clear the data and draw the buffered samples across at most half the width"""
+        self.canvas.delete("data")
+        available = len(self.buffer)
+        while self.bucket_size < self.max_bucket and available > self.width // 2 * self.bucket_size:
+            self.bucket_size = min(2 * self.bucket_size, self.max_bucket)
+        buckets = min(available // self.bucket_size, self.width // 2)
+        self.start = self.drawn = self.buffer.total - buckets * self.bucket_size
+        self.last = None
+        if buckets == 0:
+            return
+
+        samples = self.buffer.window(self.start, self.buffer.total)
+        lows, highs = minmax_decimate(samples, self.bucket_size)
+        for plot in range(len(PLOT_TITLES)):
+            rows = [i for i, (_, series_plot, _) in enumerate(SERIES) if series_plot == plot]
+            lo, hi = lows[rows].min(), highs[rows].max()
+            pad = (hi - lo) * 0.25 or 1.0
+            self.ranges[plot] = (lo - pad, hi + pad)
+            top = plot * self.plot_height
+            self.canvas.create_text(self.width - 4, top + 2, text=f"{hi + pad:.1f}", anchor="ne",
+                                    fill="gray", tags="data")
+            self.canvas.create_text(self.width - 4, top + self.plot_height - 2, text=f"{lo - pad:.1f}",
+                                    anchor="se", fill="gray", tags="data")
+        self._draw_buckets(0, samples, lows, highs)
+        self.drawn = self.buffer.total
+
+    def _draw_buckets(self, x0: int, samples: np.ndarray, lows: np.ndarray, highs: np.ndarray) -> None:
+        """Append one vertical segment per bucket and series, joined to the previous bucket"""
+        lasts = samples[:, self.bucket_size - 1::self.bucket_size]
+        previous = np.concatenate(((lasts[:, :1] if self.last is None else self.last[:, None]), lasts[:, :-1]), axis=1)
+        lows = np.minimum(lows, previous)
+        highs = np.maximum(highs, previous)
+        for i, (_, plot, color) in enumerate(SERIES):
+            y_top = self._y(plot, highs[i]).tolist()
+            y_bottom = self._y(plot, lows[i]).tolist()
+            for offset, (y0, y1) in enumerate(zip(y_top, y_bottom)):
+                x = x0 + offset
+                self.canvas.create_line(x, y0, x, y1 + 1, fill=color, tags="data")
+        self.last = lasts[:, -1]
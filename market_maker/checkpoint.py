@@ -0,0 +1,135 @@
+"""
+Versioned binary checkpoints of game, market maker and RNG state.
+
+Layout (little endian): header (magic, format version, game count, rounds
+completed), then for each game its name, class name and the bytes produced by
+`Game.pack_state`, which include the game's and market maker's RNG streams
+and any risk engine attached to the market maker.
+"""
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Tuple, Union
+from .games.game import Game
+
+MAGIC = b"MMCK"
+FORMAT_VERSION = 6
+
+_HEADER = struct.Struct("<4sHHQ")  # magic, version, game count, rounds completed
+_LENGTH = struct.Struct("<I")
+
+
+def _pack_name(name: str) -> bytes:
+    encoded = name.encode("utf-8")
+    return bytes([len(encoded)]) + encoded
+
+
+def _unpack_name(data: bytes, offset: int) -> Tuple[str, int]:
+    end = offset + 1 + data[offset]
+    if end > len(data):
+        raise ValueError("Checkpoint is truncated")
+    return bytes(data[offset + 1:end]).decode("utf-8"), end
+
+
+def dump_state(games: Dict[str, Game], rounds: int = 0) -> bytes:
+    """Serialize all games, including their market makers and RNG streams, and the rounds completed"""
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(games), rounds)]
+    for name, game in games.items():
+        state = game.pack_state()
+        parts += [_pack_name(name), _pack_name(type(game).__name__), _LENGTH.pack(len(state)), state]
+    return b"".join(parts)
+
+
+def load_state(data: bytes, games: Dict[str, Game]) -> int:
+    """
+    Restore a dump_state snapshot into existing game instances and return the
+    rounds completed. Games are left untouched if the snapshot is corrupt.
+    """
+    data = memoryview(data)
+    if len(data) < _HEADER.size:
+        raise ValueError("Checkpoint is truncated")
+    magic, version, count, rounds = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a market maker checkpoint")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}")
+    if count != len(games):
+        raise ValueError(f"Checkpoint holds {count} games, expected {len(games)}")
+
+    offset = _HEADER.size
+
+    # Check the framing of every section before touching any game
+    sections = []
+    for _ in range(count):
+        if offset >= len(data):
+            raise ValueError("Checkpoint is truncated")
+        name, offset = _unpack_name(data, offset)
+        class_name, offset = _unpack_name(data, offset)
+        if offset + _LENGTH.size > len(data):
+            raise ValueError("Checkpoint is truncated")
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        game = games.get(name)
+        if game is None or type(game).__name__ != class_name:
+            raise ValueError(f"Checkpoint game {name!r} ({class_name}) does not match")
+        if offset + length > len(data):
+            raise ValueError(f"Checkpoint section for {name!r} is truncated")
+        sections.append((name, game, offset, offset + length))
+        offset += length
+    if offset != len(data):
+        raise ValueError("Checkpoint has trailing data")
+
+    # Each section must decode to exactly its length, otherwise roll every game back
+    backups = [game.pack_state() for _, game, _, _ in sections]
+    try:
+        for name, game, start, end in sections:
+            if game.unpack_state(data[:end], start) != end:
+                raise ValueError(f"Checkpoint section for {name!r} is corrupt")
+    except Exception as error:
+        for (_, game, _, _), backup in zip(sections, backups):
+            game.unpack_state(backup)
+        if isinstance(error, ValueError):
+            raise
+        raise ValueError("Checkpoint is corrupt") from error
+    return rounds
+
+
+def save_checkpoint(path: Union[str, Path], games: Dict[str, Game], rounds: int = 0) -> None:
+    """Atomically write a checkpoint file"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(dump_state(games, rounds))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: Union[str, Path], games: Dict[str, Game]) -> int:
+    """Restore games from a checkpoint file and return the rounds completed"""
+    return load_state(Path(path).read_bytes(), games)
+
+
+class Checkpointer:
+    """Writes a checkpoint every `interval` rounds during a long run"""
+
+    def __init__(self, path: Union[str, Path], games: Dict[str, Game], interval: int = 10000):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.path = Path(path)
+        self.games = games
+        self.interval = interval
+        self.rounds = 0
+
+    def resume(self) -> bool:
+        """Restore games and the round count from the checkpoint file if one exists"""
+        if not self.path.exists():
+            return False
+        self.rounds = load_checkpoint(self.path, self.games)
+        return True
+
+    def round_completed(self) -> None:
+        """Count a finished round and checkpoint when the interval is reached"""
+        self.rounds += 1
+        if self.rounds % self.interval == 0:
+            save_checkpoint(self.path, self.games, self.rounds)
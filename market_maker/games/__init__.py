@@ -0,0 +1,6 @@
+from .game import Game
+from .dice import DiceGame
+from .poker import PokerGame
+from .coin import CoinGame
+
+__all__ = ["Game", "DiceGame", "PokerGame", "CoinGame"]
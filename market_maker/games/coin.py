@@ -1,10 +1,11 @@
-from typing import Dict, Any
-import random
+from typing import Dict, Any, List, Optional, Tuple
+import itertools
 from .game import Game
+from ..rng import RandomService
 
 class CoinGame(Game):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: Optional[RandomService] = None):
+        super().__init__(rng)
         self.num_coins = 3
         self.outcomes = {
             "all_heads": "All heads",
@@ -25,11 +26,11 @@ class CoinGame(Game):
         # Add randomness to house edge for each outcome
         # This creates slightly different odds each time
         house_edges = {
-            "all_heads": base_house_edge + random.uniform(-0.02, 0.05),
-            "two_consecutive_heads": base_house_edge + random.uniform(-0.01, 0.04),
-            "alternating": base_house_edge + random.uniform(-0.015, 0.045),
-            "two_heads": base_house_edge + random.uniform(-0.01, 0.03),
-            "two_tails": base_house_edge + random.uniform(-0.01, 0.03)
+            "all_heads": base_house_edge + self.rng.uniform(-0.02, 0.05),
+            "two_consecutive_heads": base_house_edge + self.rng.uniform(-0.01, 0.04),
+            "alternating": base_house_edge + self.rng.uniform(-0.015, 0.045),
+            "two_heads": base_house_edge + self.rng.uniform(-0.01, 0.03),
+            "two_tails": base_house_edge + self.rng.uniform(-0.01, 0.03)
         }
         
         # Calculate probabilities
@@ -43,19 +44,17 @@ class CoinGame(Game):
         market_fluctuation = 0.1  # 10% maximum fluctuation
         
         odds = {
-            "all_heads": (1 / prob_all_heads) * (1 + house_edges["all_heads"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "two_consecutive_heads": (1 / prob_two_consecutive) * (1 + house_edges["two_consecutive_heads"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "alternating": (1 / prob_alternating) * (1 + house_edges["alternating"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "two_heads": (1 / prob_two_heads) * (1 + house_edges["two_heads"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "two_tails": (1 / prob_two_tails) * (1 + house_edges["two_tails"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation))
+            "all_heads": (1 / prob_all_heads) * (1 + house_edges["all_heads"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "two_consecutive_heads": (1 / prob_two_consecutive) * (1 + house_edges["two_consecutive_heads"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "alternating": (1 / prob_alternating) * (1 + house_edges["alternating"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "two_heads": (1 / prob_two_heads) * (1 + house_edges["two_heads"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "two_tails": (1 / prob_two_tails) * (1 + house_edges["two_tails"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation))
         }
         
         return odds
 
-    def play_round(self) -> Dict[str, Any]:
-        flips = ['H' if random.random() > 0.5 else 'T' for _ in range(self.num_coins)]
-        
-        # Check all outcomes
+    def _evaluate(self, flips: List[str]) -> Dict[str, Any]:
+        """Determine outcomes for a sequence of flips"""
         outcomes = {
             "all_heads": all(flip == 'H' for flip in flips),
             "two_consecutive_heads": any(flips[i:i+2] == ['H', 'H'] for i in range(len(flips)-1)),
@@ -63,6 +62,17 @@ class CoinGame(Game):
             "two_heads": sum(flip == 'H' for flip in flips) == 2,
             "two_tails": sum(flip == 'T' for flip in flips) == 2
         }
+        return {"flips": flips, "outcomes": outcomes}
+
+    def outcome_distribution(self) -> List[Tuple[float, Dict[str, Any]]]:
+        probability = 1 / 2 ** self.num_coins
+        return [(probability, self._evaluate(list(flips)))
+                for flips in itertools.product('HT', repeat=self.num_coins)]
+
+    def play_round(self) -> Dict[str, Any]:
+        flips = ['H' if u > 0.5 else 'T' for u in self.rng.take(self.num_coins)]
+        results = self._evaluate(flips)
+        outcomes = results["outcomes"]
         
         # Process winnings
         for outcome, won in outcomes.items():
@@ -70,11 +80,6 @@ class CoinGame(Game):
                 bet_amount = self.active_bets[outcome]
                 self.player_balance += bet_amount * self.current_odds[outcome]
         
-        results = {
-            "flips": flips,
-            "outcomes": outcomes
-        }
-        
         # Clear bets after round
         self.clear_bets()
         
@@ -1,10 +1,11 @@
-from typing import Dict, Any
-import random
+from typing import Dict, Any, List, Optional, Tuple
+import itertools
 from .game import Game
+from ..rng import RandomService
 
 class DiceGame(Game):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: Optional[RandomService] = None):
+        super().__init__(rng)
         self.num_dice = 3
         self.outcomes = {
             "sum_3": "Sum of 3 dice is 3",
@@ -22,9 +23,9 @@ class DiceGame(Game):
         
         # Add randomness to house edge for each outcome
         house_edges = {
-            "sum_3": base_house_edge + random.uniform(-0.02, 0.05),
-            "sum_5_10": base_house_edge + random.uniform(-0.01, 0.04),
-            "sum_18": base_house_edge + random.uniform(-0.02, 0.05),
+            "sum_3": base_house_edge + self.rng.uniform(-0.02, 0.05),
+            "sum_5_10": base_house_edge + self.rng.uniform(-0.01, 0.04),
+            "sum_18": base_house_edge + self.rng.uniform(-0.02, 0.05),
         }
         
         # Probability calculations
@@ -37,23 +38,32 @@ class DiceGame(Game):
         
         # Convert probabilities to odds and add house edge
         odds = {
-            "sum_3": (1 / prob_sum_3) * (1 + house_edges["sum_3"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "sum_5_10": (1 / prob_sum_5_10) * (1 + house_edges["sum_5_10"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "sum_18": (1 / prob_sum_18) * (1 + house_edges["sum_18"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation))
+            "sum_3": (1 / prob_sum_3) * (1 + house_edges["sum_3"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "sum_5_10": (1 / prob_sum_5_10) * (1 + house_edges["sum_5_10"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "sum_18": (1 / prob_sum_18) * (1 + house_edges["sum_18"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation))
         }
         
         return odds
 
-    def play_round(self) -> Dict[str, Any]:
-        dice_rolls = [random.randint(1, 6) for _ in range(self.num_dice)]
+    def _evaluate(self, dice_rolls: List[int]) -> Dict[str, Any]:
+        """Determine outcomes for a set of dice rolls"""
         total = sum(dice_rolls)
-        
-        # Determine outcomes
         outcomes = {
             "sum_3": total == 3,
             "sum_5_10": total in [5, 10],
             "sum_18": total == 18
         }
+        return {"dice_rolls": dice_rolls, "total": total, "outcomes": outcomes}
+
+    def outcome_distribution(self) -> List[Tuple[float, Dict[str, Any]]]:
+        probability = 1 / 6 ** self.num_dice
+        return [(probability, self._evaluate(list(rolls)))
+                for rolls in itertools.product(range(1, 7), repeat=self.num_dice)]
+
+    def play_round(self) -> Dict[str, Any]:
+        dice_rolls = self.rng.randints(1, 6, self.num_dice)
+        results = self._evaluate(dice_rolls)
+        outcomes = results["outcomes"]
         
         # Process winnings
         for outcome, won in outcomes.items():
@@ -64,12 +74,6 @@ class DiceGame(Game):
                     self.player_balance += bet_amount + (bet_amount * (self.current_odds[outcome] - 1))
                 # If bet lost, money is already deducted when bet was placed
         
-        results = {
-            "dice_rolls": dice_rolls,
-            "total": total,
-            "outcomes": outcomes
-        }
-        
         # Clear bets after round
         self.clear_bets()
         
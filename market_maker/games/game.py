@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+import struct
+from ..rng import RandomService
+from ..serialization import pack_indexed_floats, unpack_indexed_floats
+
+_STATE = struct.Struct("<ddd")  # balance, min bet, max bet
 
 class Game(ABC):
-    def __init__(self):
+    def __init__(self, rng: Optional[RandomService] = None):
+        self.rng = rng or RandomService()
         self.current_odds: Dict[str, float] = {}
         self.min_bet: float = 1.0
         self.max_bet: float = 1000.0
         self.player_balance: float = 0
         self.active_bets: Dict[str, float] = {}  # Track bets for each outcome
+        self.outcomes: Dict[str, str] = {}
 
     @abstractmethod
     def initialize_game(self) -> None:
@@ -24,6 +31,11 @@ class Game(ABC):
         """Play one round of the game and return results"""
         pass
 
+    @abstractmethod
+    def outcome_distribution(self) -> List[Tuple[float, Dict[str, Any]]]:
+        """Exact distribution of round results as (probability, results) pairs"""
+        pass
+
     def place_bet(self, outcome: str, amount: float) -> bool:
         """
         Place a bet on a specific outcome
@@ -46,4 +58,21 @@ class Game(ABC):
 
     def clear_bets(self) -> None:
         """Clear all active bets after a round"""
-        self.active_bets.clear() 
\ No newline at end of file
+        self.active_bets.clear()
+
+    def pack_state(self) -> bytes:
+        """Serialize RNG position, balance, bet limits, odds and active bets"""
+        keys = list(self.outcomes)
+        return (self.rng.pack_state()
+                + _STATE.pack(self.player_balance, self.min_bet, self.max_bet)
+                + pack_indexed_floats(self.current_odds, keys)
+                + pack_indexed_floats(self.active_bets, keys))
+
+    def unpack_state(self, data: bytes, offset: int = 0) -> int:
+        """Restore state written by pack_state and return the offset after it"""
+        keys = list(self.outcomes)
+        offset = self.rng.unpack_state(data, offset)
+        self.player_balance, self.min_bet, self.max_bet = _STATE.unpack_from(data, offset)
+        self.current_odds, offset = unpack_indexed_floats(data, offset + _STATE.size, keys)
+        self.active_bets, offset = unpack_indexed_floats(data, offset, keys)
+        return offset
@@ -1,14 +1,28 @@
-from typing import Dict, Any, List, Tuple
-import random
+from typing import Dict, Any, Hashable, List, Optional, Tuple
+import itertools
+import math
+import struct
 from .game import Game
+from ..rng import RandomService
 from ..market_maker import MarketMaker
 
+_COUNT = struct.Struct("<I")
+_TRADE = struct.Struct("<d?d")  # amount, is_buy, initial price
+_REVEAL = struct.Struct("<?I")  # reveal in progress, cards revealed
+
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# Per hand size: conditional means and variances of the final card sum indexed by
+# partial hand node, plus the value class of each card value
+_conditional_tables: Dict[int, Tuple[List[float], List[float], Dict[int, int]]] = {}
+
 class PokerGame(Game):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng: Optional[RandomService] = None):
+        super().__init__(rng)
         self.deck = self._create_deck()
         self.num_cards = 3
-        self.market_maker = MarketMaker()
+        self.market_maker = MarketMaker(self.rng.spawn())
         self.outcomes = {
             "sum_under_10": "Sum of cards under 10",
             "sum_10_20": "Sum of cards between 10-20",
@@ -18,6 +32,9 @@ class PokerGame(Game):
         }
         # Track market maker trades
         self.mm_trades: List[Tuple[float, bool, float]] = []  # [(amount, is_buy, initial_price), ...]
+        # Cards shown so far in sequential reveal mode, None when no reveal is in progress
+        self.revealed_cards: Optional[List[Tuple[str, str]]] = None
+        self._reveal_node = 0
         self.initialize_game()
 
     def initialize_game(self) -> None:
@@ -28,12 +45,10 @@ class PokerGame(Game):
         self.mm_trades.clear()
 
     def _create_deck(self) -> List[Tuple[str, str]]:
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        return [(rank, suit) for suit in suits for rank in ranks]
+        return [(rank, suit) for suit in SUITS for rank in RANKS]
 
     def _shuffle_deck(self) -> None:
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
 
     def _card_value(self, card: Tuple[str, str]) -> int:
         rank = card[0]
@@ -48,11 +63,11 @@ class PokerGame(Game):
         
         # Add randomness to house edge for each outcome
         house_edges = {
-            "sum_under_10": base_house_edge + random.uniform(-0.02, 0.04),
-            "sum_10_20": base_house_edge + random.uniform(-0.015, 0.035),
-            "sum_over_20": base_house_edge + random.uniform(-0.02, 0.04),
-            "all_same_suit": base_house_edge + random.uniform(-0.01, 0.06),
-            "all_face_cards": base_house_edge + random.uniform(-0.01, 0.06)
+            "sum_under_10": base_house_edge + self.rng.uniform(-0.02, 0.04),
+            "sum_10_20": base_house_edge + self.rng.uniform(-0.015, 0.035),
+            "sum_over_20": base_house_edge + self.rng.uniform(-0.02, 0.04),
+            "all_same_suit": base_house_edge + self.rng.uniform(-0.01, 0.06),
+            "all_face_cards": base_house_edge + self.rng.uniform(-0.01, 0.06)
         }
         
         # Calculate probabilities
@@ -67,16 +82,16 @@ class PokerGame(Game):
         market_fluctuation = 0.10  # 10% maximum fluctuation for poker (more volatile)
         
         odds = {
-            "sum_under_10": (1 / prob_under_10) * (1 + house_edges["sum_under_10"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "sum_10_20": (1 / prob_10_20) * (1 + house_edges["sum_10_20"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "sum_over_20": (1 / prob_over_20) * (1 + house_edges["sum_over_20"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "all_same_suit": (1 / prob_same_suit) * (1 + house_edges["all_same_suit"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation)),
-            "all_face_cards": (1 / prob_all_face) * (1 + house_edges["all_face_cards"]) * (1 + random.uniform(-market_fluctuation, market_fluctuation))
+            "sum_under_10": (1 / prob_under_10) * (1 + house_edges["sum_under_10"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "sum_10_20": (1 / prob_10_20) * (1 + house_edges["sum_10_20"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "sum_over_20": (1 / prob_over_20) * (1 + house_edges["sum_over_20"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "all_same_suit": (1 / prob_same_suit) * (1 + house_edges["all_same_suit"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation)),
+            "all_face_cards": (1 / prob_all_face) * (1 + house_edges["all_face_cards"]) * (1 + self.rng.uniform(-market_fluctuation, market_fluctuation))
         }
         
         return odds
 
-    def place_market_trade(self, amount: float, is_buy: bool) -> bool:
+    def place_market_trade(self, amount: float, is_buy: bool, client: Hashable = 0) -> bool:
         """Place a trade with the market maker"""
         if amount <= 0:
             return False
@@ -92,7 +107,7 @@ class PokerGame(Game):
         if trade_cost > self.player_balance:
             return False
         
-        success = self.market_maker.place_trade(amount, is_buy)
+        success = self.market_maker.place_trade(amount, is_buy, client)
         if success:
             # Deduct the actual cost (not just the number of shares)
             self.player_balance -= trade_cost
@@ -105,17 +120,85 @@ class PokerGame(Game):
         """Get current market maker bid/ask prices"""
         return self.market_maker.get_prices()
 
-    def play_round(self) -> Dict[str, Any]:
-        # Reset deck and shuffle
+    def _conditional_table(self) -> Tuple[List[float], List[float], Dict[int, int]]:
+        """
+        Build (once per hand size) the exact conditional mean and variance of the
+        final sum for every partial hand. Partial hands are indexed as nodes of a
+        trie over card value classes: child = parent * (classes + 1) + class + 1.
+        """
+        if self.num_cards not in _conditional_tables:
+            values = [self._card_value(card) for card in self._create_deck()]
+            distinct = sorted(set(values))
+            counts = [values.count(value) for value in distinct]
+            base = len(distinct) + 1
+            means = [float('nan')] * base ** self.num_cards
+            variances = list(means)
+            total, total_sq = sum(values), sum(value * value for value in values)
+
+            def fill(node, seen, seen_sum, seen_sq):
+                # Remaining cards are drawn without replacement from what is left of the deck
+                remaining = len(values) - seen
+                to_draw = self.num_cards - seen
+                mean = (total - seen_sum) / remaining
+                variance = (total_sq - seen_sq) / remaining - mean ** 2
+                means[node] = seen_sum + to_draw * mean
+                variances[node] = to_draw * variance * (remaining - to_draw) / (remaining - 1)
+                if to_draw == 0:
+                    return
+                for i, value in enumerate(distinct):
+                    if counts[i]:
+                        counts[i] -= 1
+                        fill(node * base + i + 1, seen + 1, seen_sum + value, seen_sq + value * value)
+                        counts[i] += 1
+
+            fill(0, 0, 0, 0)
+            _conditional_tables[self.num_cards] = (means, variances, {value: i for i, value in enumerate(distinct)})
+        return _conditional_tables[self.num_cards]
+
+    def _child_node(self, node: int, card: Tuple[str, str]) -> int:
+        _, _, value_class = self._conditional_table()
+        return node * (len(value_class) + 1) + value_class[self._card_value(card)] + 1
+
+    def conditional_sum(self) -> Tuple[float, float]:
+        """Expected final card sum and its standard deviation given the revealed cards"""
+        means, variances, _ = self._conditional_table()
+        return means[self._reveal_node], variances[self._reveal_node] ** 0.5
+
+    def start_reveal(self) -> Tuple[float, float]:
+        """Shuffle a fresh deck for a sequential round and quote around the prior expected sum"""
         self.deck = self._create_deck()
         self._shuffle_deck()
-        # Draw cards
-        drawn_cards = [self.deck.pop() for _ in range(self.num_cards)]
-        
-        # Calculate sum of card values
+        self.revealed_cards = []
+        self._reveal_node = 0
+        return self.market_maker.quote(self.conditional_sum()[0])
+
+    def reveal_card(self) -> Dict[str, Any]:
+        """Reveal the next card and re-quote around the conditional expected sum"""
+        if self.revealed_cards is None:
+            raise ValueError("No sequential round in progress, call start_reveal first")
+        if len(self.revealed_cards) >= self.num_cards:
+            raise ValueError("All cards have been revealed")
+        card = self.deck.pop()
+        self.revealed_cards.append(card)
+        self._reveal_node = self._child_node(self._reveal_node, card)
+        expected_sum, sum_std = self.conditional_sum()
+        return {
+            "card": card,
+            "revealed_cards": list(self.revealed_cards),
+            "expected_sum": expected_sum,
+            "sum_std": sum_std,
+            "market_prices": self.market_maker.quote(expected_sum)
+        }
+
+    def place_bet(self, outcome: str, amount: float) -> bool:
+        """Place a bet, rejected once cards are revealed since the fixed odds are not repriced"""
+        if self.revealed_cards:
+            return False
+        return super().place_bet(outcome, amount)
+
+    def _evaluate(self, drawn_cards: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Determine the card sum and outcomes for a set of drawn cards"""
         total = sum(self._card_value(card) for card in drawn_cards)
-        
-        # Check all outcomes
         outcomes = {
             "sum_under_10": total < 10,
             "sum_10_20": 10 <= total <= 20,
@@ -123,6 +206,47 @@ class PokerGame(Game):
             "all_same_suit": len(set(card[1] for card in drawn_cards)) == 1,
             "all_face_cards": all(card[0] in ['J', 'Q', 'K'] for card in drawn_cards)
         }
+        return {"cards": drawn_cards, "sum": total, "outcomes": outcomes}
+
+    def outcome_distribution(self) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Results only depend on the ranks drawn and whether all suits match, so
+        each rank multiset is evaluated once for a suited and an unsuited
+        representative hand, weighted by how many hands it stands for.
+        """
+        total = math.comb(len(SUITS) * len(RANKS), self.num_cards)
+        distribution = []
+        for ranks in itertools.combinations_with_replacement(RANKS, self.num_cards):
+            hands = math.prod(math.comb(len(SUITS), ranks.count(rank)) for rank in set(ranks))
+            if len(set(ranks)) == len(ranks):
+                # One suited hand per suit, every other suit assignment is mixed
+                suited_hands = len(SUITS)
+                distribution.append((suited_hands / total, self._evaluate([(rank, SUITS[0]) for rank in ranks])))
+                mixed = [(rank, SUITS[i % 2]) for i, rank in enumerate(ranks)]
+            else:
+                # Repeated ranks never share a suit, so no hand is suited
+                suited_hands = 0
+                mixed = [(rank, SUITS[ranks[:i].count(rank)]) for i, rank in enumerate(ranks)]
+            if hands > suited_hands:
+                distribution.append(((hands - suited_hands) / total, self._evaluate(mixed)))
+        return distribution
+
+    def play_round(self) -> Dict[str, Any]:
+        if self.revealed_cards is None:
+            # Reset deck and shuffle
+            self.deck = self._create_deck()
+            self._shuffle_deck()
+            # Draw cards
+            drawn_cards = [self.deck.pop() for _ in range(self.num_cards)]
+        else:
+            # Finish a sequential round, drawing any cards not yet revealed
+            drawn_cards = self.revealed_cards + [self.deck.pop()
+                                                 for _ in range(self.num_cards - len(self.revealed_cards))]
+            self.revealed_cards = None
+            self._reveal_node = 0
+        results = self._evaluate(drawn_cards)
+        total = results["sum"]
+        outcomes = results["outcomes"]
         
         # Process regular bet winnings
         for outcome, won in outcomes.items():
@@ -148,12 +272,10 @@ class PokerGame(Game):
                 pnl = amount * (initial_price - total) 
                 self.player_balance += original_investment + pnl
         
-        results = {
-            "cards": drawn_cards,
-            "sum": total,
-            "outcomes": outcomes,
-            "market_prices": (bid, ask)
-        }
+        # Close out positions tracked by the market maker's risk engine
+        self.market_maker.settle(total)
+        
+        results["market_prices"] = (bid, ask)
         
         # Clear bets and trades after round
         self.clear_bets()
@@ -162,4 +284,38 @@ class PokerGame(Game):
         # Recalculate odds for next round
         self.current_odds = self.calculate_odds()
         
-        return results 
\ No newline at end of file
+        return results
+
+    def pack_state(self) -> bytes:
+        """Serialize base game state plus deck order, revealed cards, pending trades and market maker"""
+        card_index = {card: i for i, card in enumerate(self._create_deck())}
+        deck = bytes(card_index[card] for card in self.deck)
+        revealed = bytes(card_index[card] for card in self.revealed_cards or [])
+        trades = b"".join(_TRADE.pack(*trade) for trade in self.mm_trades)
+        return (super().pack_state()
+                + _COUNT.pack(len(deck)) + deck
+                + _REVEAL.pack(self.revealed_cards is not None, len(revealed)) + revealed
+                + _COUNT.pack(len(self.mm_trades)) + trades
+                + self.market_maker.pack_state())
+
+    def unpack_state(self, data: bytes, offset: int = 0) -> int:
+        offset = super().unpack_state(data, offset)
+        full_deck = self._create_deck()
+        (deck_size,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        self.deck = [full_deck[i] for i in data[offset:offset + deck_size]]
+        offset += deck_size
+        in_progress, num_revealed = _REVEAL.unpack_from(data, offset)
+        offset += _REVEAL.size
+        self.revealed_cards = None
+        self._reveal_node = 0
+        if in_progress:
+            self.revealed_cards = [full_deck[i] for i in data[offset:offset + num_revealed]]
+            for card in self.revealed_cards:
+                self._reveal_node = self._child_node(self._reveal_node, card)
+        offset += num_revealed
+        (num_trades,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        self.mm_trades = [_TRADE.unpack_from(data, offset + i * _TRADE.size) for i in range(num_trades)]
+        offset += num_trades * _TRADE.size
+        return self.market_maker.unpack_state(data, offset)
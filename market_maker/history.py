@@ -0,0 +1,108 @@
+"""
+Array-backed store of played rounds.
+
+Each round is one row of fixed-width columns (round number, game, PnL,
+won-outcome bitmask, card/dice sum and an encoded draw), so millions of
+rounds stay compact and filters run vectorized. Display strings are only
+built for the rows that are asked for.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from .games.game import Game
+from .games.poker import SUITS, RANKS
+
+_DRAW_BITS = 6  # Bits per die, coin or card index in the encoded draw
+
+
+def _draw_items(results: Dict[str, Any]) -> Tuple[str, List[int]]:
+    """Return the kind of draw in a round's results and its items as small ints"""
+    if "dice_rolls" in results:
+        return "dice_rolls", results["dice_rolls"]
+    if "flips" in results:
+        return "flips", [1 if flip == 'H' else 0 for flip in results["flips"]]
+    return "cards", [SUITS.index(suit) * len(RANKS) + RANKS.index(rank) for rank, suit in results["cards"]]
+
+
+def _encode_items(items: List[int]) -> int:
+    code = 0
+    for item in reversed(items):
+        code = (code << _DRAW_BITS) | item
+    return code
+
+
+def _decode_items(code: int, count: int) -> List[int]:
+    mask = (1 << _DRAW_BITS) - 1
+    return [(code >> (_DRAW_BITS * i)) & mask for i in range(count)]
+
+
+class RoundHistory:
+    def __init__(self, games: Dict[str, Game], capacity: int = 1024):
+        self.game_names = list(games)
+        self.outcome_names = {name: list(game.outcomes) for name, game in games.items()}
+        self._layouts: Dict[str, Tuple[str, int]] = {}  # Per game: draw kind, items per draw
+        self.size = 0
+        self._round = np.empty(capacity, dtype=np.int64)
+        self._game = np.empty(capacity, dtype=np.uint8)
+        self._pnl = np.empty(capacity, dtype=float)
+        self._won = np.empty(capacity, dtype=np.uint32)
+        self._total = np.empty(capacity, dtype=np.int16)
+        self._draw = np.empty(capacity, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        for name in ("_round", "_game", "_pnl", "_won", "_total", "_draw"):
+            column = getattr(self, name)
+            grown = np.empty(2 * len(column), dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def record(self, round_number: int, game_name: str, results: Dict[str, Any], pnl: float) -> None:
+        """Append one played round of a game"""
+        if self.size == len(self._pnl):
+            self._grow()
+        i = self.size
+        outcomes = results["outcomes"]
+        kind, items = _draw_items(results)
+        self._layouts[game_name] = (kind, len(items))
+        self._round[i] = round_number
+        self._game[i] = self.game_names.index(game_name)
+        self._pnl[i] = pnl
+        self._won[i] = sum(1 << bit for bit, outcome in enumerate(self.outcome_names[game_name]) if outcomes[outcome])
+        self._total[i] = results.get("total", results.get("sum", 0))
+        self._draw[i] = _encode_items(items)
+        self.size += 1
+
+    def select(self, game: Optional[str] = None, outcome: Optional[str] = None,
+               pnl_sign: Optional[int] = None, start: int = 0) -> np.ndarray:
+        """
+        Row indices from start onwards matching every given filter.
+        outcome (which requires game) keeps rounds where it won; pnl_sign keeps
+        profitable (1), losing (-1) or flat (0) rounds.
+        """
+        mask = np.ones(self.size - start, dtype=bool)
+        if game is not None:
+            mask &= self._game[start:self.size] == self.game_names.index(game)
+            if outcome is not None:
+                bit = 1 << self.outcome_names[game].index(outcome)
+                mask &= (self._won[start:self.size] & bit) != 0
+        if pnl_sign is not None:
+            mask &= np.sign(self._pnl[start:self.size]) == pnl_sign
+        return np.flatnonzero(mask) + start
+
+    def format_row(self, i: int) -> str:
+        """Build the display line for one row"""
+        game_name = self.game_names[self._game[i]]
+        kind, count = self._layouts[game_name]
+        items = _decode_items(int(self._draw[i]), count)
+        if kind == "dice_rolls":
+            draw = f"{items} total {self._total[i]}"
+        elif kind == "flips":
+            draw = ' '.join('H' if item else 'T' for item in items)
+        else:
+            cards = [f"{RANKS[item % len(RANKS)]}{SUITS[item // len(RANKS)][0]}" for item in items]
+            draw = f"{' '.join(cards)} sum {self._total[i]}"
+        won = [outcome for bit, outcome in enumerate(self.outcome_names[game_name]) if self._won[i] >> bit & 1]
+        return (f"#{self._round[i]:<6} {game_name:<5} {draw:<24} "
+                f"{', '.join(won) or '-':<30} {self._pnl[i]:+.2f}")
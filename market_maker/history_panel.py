@@ -0,0 +1,111 @@
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+from .history import RoundHistory
+
+ALL = "All"
+PNL_FILTERS = {ALL: None, "Profit": 1, "Loss": -1, "Flat": 0}
+
+
+class HistoryPanel(ttk.LabelFrame):
+    """
+    Scrollable round history that only formats the rows currently visible.
+    Rows matching the filters are kept as an index array over the history and
+    extended incrementally as rounds are recorded. Newest rounds are shown first.
+    """
+
+    def __init__(self, parent, history: RoundHistory, visible_rows: int = 8):
+        super().__init__(parent, text="History", padding="5")
+        self.history = history
+        self.visible_rows = visible_rows
+        self.top = 0                            # Offset of the first visible row, 0 = newest
+        self._rows = np.empty(1024, dtype=np.intp)  # Matching history rows, oldest first
+        self._count = 0                             # Used length of _rows
+        self._scanned = 0                           # History rows already checked against the filters
+
+        filter_frame = ttk.Frame(self)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky="w")
+        self.game_filter = self._add_filter(filter_frame, 0, "Game:", [ALL] + history.game_names)
+        self.outcome_filter = self._add_filter(filter_frame, 2, "Outcome:", [ALL])
+        self.pnl_filter = self._add_filter(filter_frame, 4, "PnL:", list(PNL_FILTERS))
+
+        self.listbox = tk.Listbox(self, height=visible_rows, width=80, font="TkFixedFont", activestyle="none")
+        self.listbox.grid(row=1, column=0, sticky="we")
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        for event in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.listbox.bind(event, self._on_wheel)
+        self.render()
+
+    def _add_filter(self, frame, column, label, values) -> ttk.Combobox:
+        ttk.Label(frame, text=label).grid(row=0, column=column, padx=(5, 2))
+        combo = ttk.Combobox(frame, values=values, state="readonly", width=14)
+        combo.set(ALL)
+        combo.grid(row=0, column=column + 1)
+        combo.bind("<<ComboboxSelected>>", self._on_filter_change)
+        return combo
+
+    def _filters(self) -> dict:
+        game = self.game_filter.get()
+        outcome = self.outcome_filter.get()
+        return {
+            "game": None if game == ALL else game,
+            "outcome": None if game == ALL or outcome == ALL else outcome,
+            "pnl_sign": PNL_FILTERS[self.pnl_filter.get()]
+        }
+
+    def _on_filter_change(self, event=None) -> None:
+        game = self.game_filter.get()
+        outcomes = [ALL] + (self.history.outcome_names[game] if game != ALL else [])
+        self.outcome_filter.config(values=outcomes)
+        if self.outcome_filter.get() not in outcomes:
+            self.outcome_filter.set(ALL)
+        self._count = 0
+        self._scanned = 0
+        self.top = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Pick up newly recorded rounds and redraw"""
+        if self._scanned < len(self.history):
+            new_rows = self.history.select(start=self._scanned, **self._filters())
+            self._scanned = len(self.history)
+            needed = self._count + len(new_rows)
+            if needed > len(self._rows):
+                grown = np.empty(max(needed, 2 * len(self._rows)), dtype=np.intp)
+                grown[:self._count] = self._rows[:self._count]
+                self._rows = grown
+            self._rows[self._count:needed] = new_rows
+            self._count = needed
+            # Keep the view anchored unless it is following the newest rounds
+            if self.top:
+                self.top += len(new_rows)
+        self.render()
+
+    def render(self) -> None:
+        count = self._count
+        self.top = max(0, min(self.top, count - self.visible_rows))
+        end = min(self.top + self.visible_rows, count)
+        self.listbox.delete(0, tk.END)
+        for offset in range(self.top, end):
+            self.listbox.insert(tk.END, self.history.format_row(self._rows[count - 1 - offset]))
+        if count:
+            self.scrollbar.set(self.top / count, end / count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_scroll(self, action, amount, unit=None) -> None:
+        if action == "moveto":
+            self.top = int(float(amount) * self._count)
+        else:
+            step = self.visible_rows if unit == "pages" else 1
+            self.top += int(amount) * step
+        self.render()
+
+    def _on_wheel(self, event) -> str:
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.top -= 3
+        else:
+            self.top += 3
+        self.render()
+        return "break"
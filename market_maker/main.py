@@ -1,14 +1,16 @@
-import tkinter as tk
 import sys
 import os
 from pathlib import Path
-from typing import Optional
-from .ui import GameUI
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from .ui import GameUI
 
 class MarketMakingApp:
     def __init__(self):
-        self.root: Optional[tk.Tk] = None
-        self.ui: Optional[GameUI] = None
+        self.root: Optional["tk.Tk"] = None
+        self.ui: Optional["GameUI"] = None
         
     def setup_environment(self) -> None:
         """Setup necessary environment variables and paths"""
@@ -23,6 +25,10 @@ class MarketMakingApp:
     def initialize(self) -> None:
         """Initialize the application"""
         try:
+            # Tk is only loaded once the UI actually starts
+            import tkinter as tk
+            from .ui import GameUI
+
             # Setup Tkinter root
             self.root = tk.Tk()
             
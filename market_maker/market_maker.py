@@ -1,8 +1,15 @@
-from typing import Tuple
-import random
+from typing import Hashable, Optional, Tuple
+import struct
+from .risk import RiskEngine, RiskLimits
+from .rng import RandomService
+
+# bid, ask, spread, volatility, position, max position, inventory impact
+_STATE = struct.Struct("<7d")
+_HAS_RISK = struct.Struct("<?")
 
 class MarketMaker:
-    def __init__(self):
+    def __init__(self, rng: Optional[RandomService] = None):
+        self.rng = rng or RandomService()
         self.current_bid = 19.0  # Starting bid price
         self.current_ask = 20.0  # Starting ask price
         self.spread = 1.0        # Minimum spread
@@ -10,7 +17,14 @@ class MarketMaker:
         self.position = 0        # Net position (positive = long, negative = short)
         self.max_position = float('inf')  # Increased maximum position size
         self.inventory_impact = 0.1  # How much position affects prices
+        self.risk_engine: Optional[RiskEngine] = None
         
+    def set_risk_engine(self, risk_engine: Optional[RiskEngine]) -> None:
+        """Run pre-trade checks through a risk engine marked at the current quotes"""
+        self.risk_engine = risk_engine
+        if risk_engine is not None:
+            risk_engine.update_marks(self.current_bid, self.current_ask)
+
     def get_prices(self) -> Tuple[float, float]:
         """Get current bid and ask prices"""
         return self.current_bid, self.current_ask
@@ -22,25 +36,35 @@ class MarketMaker:
         
         # Add random market movement (30% range means ±15% from base)
         fluctuation_range = base_price * self.volatility # 30% of base price
-        market_move = random.uniform(-fluctuation_range, fluctuation_range)
+        market_move = self.rng.uniform(-fluctuation_range, fluctuation_range)
         base_price += market_move
         
+        return self.quote(base_price)
+
+    def quote(self, fair_value: float) -> Tuple[float, float]:
+        """Set bid and ask around a fair value, adjusted for inventory"""
         # Adjust for inventory position - when long (positive position), raise ask and lower bid
         # This encourages balancing the book by making selling more attractive and buying less attractive
         inventory_adjustment = self.position * self.inventory_impact
         
         # Update bid and ask while maintaining minimum spread
-        self.current_bid = base_price - self.spread/2 - inventory_adjustment
-        self.current_ask = base_price + self.spread/2 + inventory_adjustment
+        self.current_bid = fair_value - self.spread/2 - inventory_adjustment
+        self.current_ask = fair_value + self.spread/2 + inventory_adjustment
         
         # Ensure bid and ask are positive
         self.current_bid = max(0.1, self.current_bid)
         self.current_ask = max(self.current_bid + self.spread, self.current_ask)
         
+        if self.risk_engine is not None:
+            self.risk_engine.update_marks(self.current_bid, self.current_ask)
         return self.current_bid, self.current_ask
     
-    def place_trade(self, amount: float, is_buy: bool) -> bool:
+    def place_trade(self, amount: float, is_buy: bool, client: Hashable = 0) -> bool:
         """Process a trade request"""
+        price = self.current_ask if is_buy else self.current_bid
+        if self.risk_engine is not None and not self.risk_engine.check(client, amount, is_buy, price):
+            return False
+        
         # Check if trade would exceed max position
         if is_buy and self.position + amount > self.max_position:
             return False
@@ -53,8 +77,39 @@ class MarketMaker:
         else:
             self.position -= amount
         
+        if self.risk_engine is not None:
+            self.risk_engine.record(client, amount, is_buy, price)
         return True
+
+    def settle(self, price: float) -> None:
+        """Settle client positions tracked by the risk engine at the realized price"""
+        if self.risk_engine is not None:
+            self.risk_engine.settle(price)
     
     def get_position(self) -> float:
         """Get current position size"""
-        return self.position 
\ No newline at end of file
+        return self.position
+
+    def pack_state(self) -> bytes:
+        """Serialize RNG position, quotes, position, pricing parameters and the risk engine"""
+        state = self.rng.pack_state() + _STATE.pack(self.current_bid, self.current_ask, self.spread,
+                                                    self.volatility, self.position, self.max_position,
+                                                    self.inventory_impact)
+        if self.risk_engine is None:
+            return state + _HAS_RISK.pack(False)
+        return state + _HAS_RISK.pack(True) + self.risk_engine.pack_state()
+
+    def unpack_state(self, data: bytes, offset: int = 0) -> int:
+        """Restore state written by pack_state and return the offset after it"""
+        offset = self.rng.unpack_state(data, offset)
+        (self.current_bid, self.current_ask, self.spread, self.volatility,
+         self.position, self.max_position, self.inventory_impact) = _STATE.unpack_from(data, offset)
+        offset += _STATE.size
+        (has_risk,) = _HAS_RISK.unpack_from(data, offset)
+        offset += _HAS_RISK.size
+        if not has_risk:
+            self.risk_engine = None
+            return offset
+        if self.risk_engine is None:
+            self.risk_engine = RiskEngine(RiskLimits())
+        return self.risk_engine.unpack_state(data, offset)
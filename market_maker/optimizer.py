@@ -0,0 +1,158 @@
+"""
+Bet-slip optimizer over the live odds of all games.
+
+Each game's exact outcome distribution is compressed to its distinct
+payoff-relevant states once per game class. The joint state space across
+games is their product, so one (states x decisions) payoff matrix covers
+every bet and the market maker trade together.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from .games.game import Game
+from .games.poker import PokerGame
+
+_state_tables: Dict[type, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def _state_table(game: Game) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (probabilities, won matrix, card sums) over a game's distinct states"""
+    key = type(game)
+    if key not in _state_tables:
+        merged: Dict[Tuple, float] = {}
+        for probability, results in game.outcome_distribution():
+            state = tuple(results["outcomes"][outcome] for outcome in game.outcomes) + (results.get("sum", 0),)
+            merged[state] = merged.get(state, 0.0) + probability
+        states = np.array(list(merged), dtype=float)
+        _state_tables[key] = (np.array(list(merged.values())), states[:, :-1], states[:, -1])
+    return _state_tables[key]
+
+
+def joint_space(games: Dict[str, Game], quote: Optional[Tuple[float, float]]):
+    """Build joint probabilities, the per-unit payoff matrix, unit costs and decision labels"""
+    tables = [_state_table(game) for game in games.values()]
+    grids = np.indices([len(table[0]) for table in tables]).reshape(len(tables), -1)
+
+    probabilities = np.ones(grids.shape[1])
+    columns: List[np.ndarray] = []
+    costs: List[float] = []
+    labels: List[Tuple[str, str]] = []
+    for (name, game), (probs, won, sums), grid in zip(games.items(), tables, grids):
+        probabilities *= probs[grid]
+        odds = np.array([game.current_odds[outcome] for outcome in game.outcomes])
+        columns.append(won[grid] * odds - 1)
+        costs += [1.0] * len(odds)
+        labels += [(name, outcome) for outcome in game.outcomes]
+        if quote is not None and isinstance(game, PokerGame):
+            bid, ask = quote
+            card_sum = sums[grid][:, None]
+            columns += [card_sum - ask, bid - card_sum]
+            costs += [ask, bid]
+            labels += [(name, "buy"), (name, "sell")]
+    return probabilities, np.hstack(columns), np.array(costs), labels
+
+
+def _project(y: np.ndarray, costs: np.ndarray, upper: np.ndarray, budget: float) -> np.ndarray:
+    """Euclidean projection onto {0 <= x <= upper, costs . x <= budget}"""
+    x = np.clip(y, 0, upper)
+    if costs @ x <= budget:
+        return x
+    # Spend is piecewise linear and non-increasing in the multiplier; search its breakpoints
+    breakpoints = np.concatenate(([0.0], y / costs, (y - upper) / costs))
+    breakpoints = np.unique(breakpoints[breakpoints >= 0])
+    spend = np.clip(y - breakpoints[:, None] * costs, 0, upper) @ costs
+    i = np.argmax(spend <= budget)
+    lo, hi = breakpoints[i - 1], breakpoints[i]
+    multiplier = lo + (spend[i - 1] - budget) / (spend[i - 1] - spend[i]) * (hi - lo)
+    return np.clip(y - multiplier * costs, 0, upper)
+
+
+def _kelly(probabilities: np.ndarray, payoffs: np.ndarray, costs: np.ndarray,
+           upper: np.ndarray, bankroll: float, max_iter: int, tol: float) -> np.ndarray:
+    """Maximize expected log wealth with spectral projected gradient ascent"""
+    def growth(x):
+        wealth = 1 + payoffs @ x / bankroll
+        if wealth.min() <= 0:
+            return -np.inf, None
+        return probabilities @ np.log(wealth), payoffs.T @ (probabilities / wealth) / bankroll
+
+    x = np.zeros(len(costs))
+    value, gradient = growth(x)
+    step = bankroll
+    for _ in range(max_iter):
+        direction = _project(x + step * gradient, costs, upper, bankroll) - x
+        if np.abs(direction).max() <= tol:
+            break
+        # Backtrack until the Armijo condition holds
+        t = 1.0
+        while True:
+            candidate = x + t * direction
+            new_value, new_gradient = growth(candidate)
+            if new_value >= value + 1e-4 * t * (gradient @ direction) or t < 1e-12:
+                break
+            t *= 0.5
+        # Barzilai-Borwein step for the next iteration
+        s, g = candidate - x, new_gradient - gradient
+        curvature = -(s @ g)
+        step = (s @ s) / curvature if curvature > 0 else step * 2
+        x, value, gradient = candidate, new_value, new_gradient
+    return x
+
+
+def _max_ev(expected: np.ndarray, costs: np.ndarray, upper: np.ndarray, bankroll: float) -> np.ndarray:
+    """Fill positive-EV decisions in order of expected return per unit cost"""
+    x = np.zeros(len(costs))
+    remaining = bankroll
+    for i in np.argsort(-expected / costs):
+        if expected[i] <= 0 or remaining <= 0:
+            break
+        x[i] = min(upper[i], remaining / costs[i])
+        remaining -= x[i] * costs[i]
+    return x
+
+
+def optimize_slip(games: Dict[str, Game], bankroll: float, objective: str = "kelly",
+                  quote: Optional[Tuple[float, float]] = None,
+                  max_iter: int = 500, tol: float = 1e-3) -> Dict[str, Any]:
+    """
+    Compute the optimal slip across games for the current odds.
+    objective is "kelly" (maximize expected log growth) or "ev" (maximize
+    expected PnL). quote defaults to the poker market maker's bid/ask.
+    Stakes respect each game's min_bet/max_bet and the whole slip, including
+    the market maker trade, costs at most the bankroll.
+    """
+    if objective not in ("kelly", "ev"):
+        raise ValueError(f"Unknown objective {objective!r}")
+    if quote is None:
+        poker = next((game for game in games.values() if isinstance(game, PokerGame)), None)
+        quote = poker.get_market_prices() if poker is not None else None
+
+    probabilities, payoffs, costs, labels = joint_space(games, quote)
+    upper = np.array([bankroll / cost if decision in ("buy", "sell") else games[name].max_bet
+                      for (name, decision), cost in zip(labels, costs)])
+    min_bets = np.array([0.0 if decision in ("buy", "sell") else games[name].min_bet
+                         for name, decision in labels])
+
+    # Stakes below the table minimum cannot be placed; fix them at 0 and re-solve the rest
+    while True:
+        if objective == "kelly":
+            x = _kelly(probabilities, payoffs, costs, upper, bankroll, max_iter, tol)
+        else:
+            x = _max_ev(probabilities @ payoffs, costs, upper, bankroll)
+        too_small = x < np.maximum(min_bets, tol)
+        x[too_small] = 0.0
+        if not (too_small & (upper > 0)).any():
+            break
+        upper = np.where(too_small, 0.0, upper)
+
+    pnl = payoffs @ x
+    slip: Dict[str, Dict[str, float]] = {name: {} for name in games}
+    for (name, decision), amount in zip(labels, x):
+        if amount > 0:
+            slip[name][decision] = float(amount)
+    wealth = 1 + pnl / bankroll
+    return {
+        "slip": slip,
+        "expected_pnl": float(probabilities @ pnl),
+        "expected_log_growth": float(probabilities @ np.log(wealth)) if wealth.min() > 0 else float("-inf"),
+        "win_probability": float(probabilities[pnl > 0].sum()),
+    }
@@ -0,0 +1,66 @@
+"""
+What-if statistics for a bet slip before it is submitted.
+
+The per-decision payoff matrix over the joint outcome space is cached and
+only rebuilt when odds or market maker quotes change. Changing one stake
+updates the slip's PnL vector with a single column, so previews stay cheap
+while the player types.
+"""
+from typing import Dict, Hashable, Tuple
+import numpy as np
+from .games.game import Game
+from .games.poker import PokerGame
+from .optimizer import joint_space
+
+
+class SlipPreview:
+    def __init__(self, games: Dict[str, Game]):
+        self.games = games
+        self.stakes: Dict[Tuple[str, str], float] = {}  # (game, outcome or "buy"/"sell") -> amount
+        self._market_key: Hashable = None
+
+    def _current_market_key(self) -> Hashable:
+        quotes = tuple(game.get_market_prices() for game in self.games.values() if isinstance(game, PokerGame))
+        return quotes + tuple(tuple(game.current_odds.values()) for game in self.games.values())
+
+    def _rebuild(self) -> None:
+        poker = next((game for game in self.games.values() if isinstance(game, PokerGame)), None)
+        quote = poker.get_market_prices() if poker is not None else None
+        self.probabilities, self.payoffs, _, labels = joint_space(self.games, quote)
+        self._columns = {label: j for j, label in enumerate(labels)}
+        self._amounts = np.zeros(len(labels))
+        for label, amount in self.stakes.items():
+            self._amounts[self._columns[label]] = amount
+        self._pnl = self.payoffs @ self._amounts
+
+    def set_stake(self, game: str, decision: str, amount: float) -> None:
+        """Set the amount on one outcome, or market maker shares for "buy"/"sell" """
+        self.stakes[(game, decision)] = amount
+        if self._market_key is not None:
+            j = self._columns[(game, decision)]
+            delta = amount - self._amounts[j]
+            if delta:
+                self._pnl += self.payoffs[:, j] * delta
+                self._amounts[j] = amount
+
+    def clear(self) -> None:
+        self.stakes.clear()
+        if self._market_key is not None:
+            self._amounts[:] = 0
+            self._pnl[:] = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Expected PnL, win probability, worst case and standard deviation of the slip"""
+        market_key = self._current_market_key()
+        if market_key != self._market_key:
+            self._rebuild()
+            self._market_key = market_key
+        probabilities, pnl = self.probabilities, self._pnl
+        expected = probabilities @ pnl
+        variance = max(probabilities @ (pnl * pnl) - expected ** 2, 0.0)
+        return {
+            "expected_pnl": float(expected),
+            "win_probability": float(probabilities[pnl > 0].sum()),
+            "worst_case": float(pnl.min()),
+            "std": float(np.sqrt(variance)),
+        }
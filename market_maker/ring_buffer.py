@@ -0,0 +1,30 @@
+from typing import Sequence, Tuple
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-size buffer holding the latest `capacity` samples of several series"""
+
+    def __init__(self, num_series: int, capacity: int):
+        self.capacity = capacity
+        self.data = np.zeros((num_series, capacity))
+        self.total = 0  # Samples ever appended
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, values: Sequence[float]) -> None:
+        self.data[:, self.total % self.capacity] = values
+        self.total += 1
+
+    def window(self, start: int, end: int) -> np.ndarray:
+        """Samples with absolute positions [start, end), which must still be buffered"""
+        if start < self.total - self.capacity:
+            raise IndexError("Samples are no longer buffered")
+        return self.data.take(np.arange(start, end) % self.capacity, axis=1)
+
+
+def minmax_decimate(samples: np.ndarray, bucket_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce (series, n) samples to per-bucket minima and maxima; n must be a multiple of bucket_size"""
+    buckets = samples.reshape(samples.shape[0], -1, bucket_size)
+    return buckets.min(axis=2), buckets.max(axis=2)
@@ -0,0 +1,208 @@
+"""
+Pre-trade risk checks for the market maker.
+
+Each client's position, open cost and realized PnL are kept per client, and
+long/short totals are kept in aggregate, so every check and update is O(1).
+Positions are marked to market at the bid (longs) or ask (shorts).
+"""
+from typing import Dict, Hashable, Optional, Set, Tuple
+import struct
+
+INF = float('inf')
+
+_LIMITS = struct.Struct("<7d")
+# bid, ask, long position, short position, open cost, realized, halted, client count
+_ENGINE = struct.Struct("<6d?I")
+_CLIENT = struct.Struct("<3d?")  # position, cost, realized, killed
+_INT_KEY = struct.Struct("<Bq")
+_STR_KEY = struct.Struct("<BH")  # tag, encoded length
+
+
+class RiskLimits:
+    def __init__(self, max_position: float = INF, max_notional: float = INF, max_loss: float = INF,
+                 max_total_position: float = INF, max_total_notional: float = INF,
+                 client_kill_loss: float = INF, house_kill_loss: float = INF):
+        self.max_position = max_position              # Per client absolute position
+        self.max_notional = max_notional              # Per client position value
+        self.max_loss = max_loss                      # Per client MTM loss a trade may lead to
+        self.max_total_position = max_total_position  # Absolute net position across clients
+        self.max_total_notional = max_total_notional  # Gross position value across clients
+        self.client_kill_loss = client_kill_loss      # Client loss that blocks the client
+        self.house_kill_loss = house_kill_loss        # Market maker loss that halts all trading
+
+
+class ClientRisk:
+    __slots__ = ("position", "cost", "realized", "killed")
+
+    def __init__(self):
+        self.position = 0.0   # Signed shares, positive = long
+        self.cost = 0.0       # Cash paid for the open position
+        self.realized = 0.0   # PnL from settled positions
+        self.killed = False
+
+
+def _pack_key(client: Hashable) -> bytes:
+    if isinstance(client, int):
+        return _INT_KEY.pack(0, client)
+    if isinstance(client, str):
+        encoded = client.encode("utf-8")
+        return _STR_KEY.pack(1, len(encoded)) + encoded
+    raise ValueError(f"Cannot checkpoint client key {client!r}, use an int or str")
+
+
+def _unpack_key(data: bytes, offset: int) -> Tuple[Hashable, int]:
+    if data[offset] == 0:
+        return _INT_KEY.unpack_from(data, offset)[1], offset + _INT_KEY.size
+    _, length = _STR_KEY.unpack_from(data, offset)
+    start = offset + _STR_KEY.size
+    return bytes(data[start:start + length]).decode("utf-8"), start + length
+
+
+# Read-only state for clients that have not traded yet
+_NEW_CLIENT = ClientRisk()
+
+
+class RiskEngine:
+    def __init__(self, limits: RiskLimits, bid: float = 0.0, ask: float = 0.0):
+        self.limits = limits
+        self.bid = bid
+        self.ask = ask
+        self.clients: Dict[Hashable, ClientRisk] = {}
+        self._open: Set[ClientRisk] = set()  # Clients holding a position
+        self.long_position = 0.0   # Sum of client long positions
+        self.short_position = 0.0  # Sum of client short positions (positive)
+        self.open_cost = 0.0
+        self.realized = 0.0
+        self.halted = False
+
+    def _client(self, client: Hashable) -> ClientRisk:
+        state = self.clients.get(client)
+        if state is None:
+            state = self.clients[client] = ClientRisk()
+        return state
+
+    def _mark(self, position: float) -> float:
+        return self.bid if position > 0 else self.ask
+
+    def _pnl(self, state: ClientRisk) -> float:
+        return state.realized + state.position * self._mark(state.position) - state.cost
+
+    def client_pnl(self, client: Hashable) -> float:
+        """Realized plus mark-to-market PnL of one client"""
+        return self._pnl(self.clients.get(client, _NEW_CLIENT))
+
+    def total_pnl(self) -> float:
+        """Realized plus mark-to-market PnL of all clients (the market maker's loss)"""
+        return (self.realized + self.long_position * self.bid
+                - self.short_position * self.ask - self.open_cost)
+
+    def net_position(self) -> float:
+        return self.long_position - self.short_position
+
+    def check(self, client: Hashable, amount: float, is_buy: bool, price: float) -> bool:
+        """Return True if the trade passes every limit"""
+        if self.halted:
+            return False
+        state = self.clients.get(client, _NEW_CLIENT)
+        if state.killed:
+            return False
+        limits = self.limits
+        if self._pnl(state) <= -limits.client_kill_loss:
+            self._client(client).killed = True
+            return False
+
+        signed = amount if is_buy else -amount
+        position = state.position + signed
+        if abs(position) > limits.max_position or abs(position) * price > limits.max_notional:
+            return False
+        pnl_after = state.realized + position * self._mark(position) - (state.cost + signed * price)
+        if pnl_after < -limits.max_loss:
+            return False
+
+        long_after = self.long_position - max(state.position, 0.0) + max(position, 0.0)
+        short_after = self.short_position - max(-state.position, 0.0) + max(-position, 0.0)
+        if abs(long_after - short_after) > limits.max_total_position:
+            return False
+        return (long_after + short_after) * price <= limits.max_total_notional
+
+    def record(self, client: Hashable, amount: float, is_buy: bool, price: float) -> None:
+        """Apply a filled trade"""
+        state = self._client(client)
+        signed = amount if is_buy else -amount
+        self._set_position(state, state.position + signed)
+        state.cost += signed * price
+        self.open_cost += signed * price
+        self._check_house()
+
+    def _set_position(self, state: ClientRisk, position: float) -> None:
+        self.long_position += max(position, 0.0) - max(state.position, 0.0)
+        self.short_position += max(-position, 0.0) - max(-state.position, 0.0)
+        state.position = position
+        if position:
+            self._open.add(state)
+        else:
+            self._open.discard(state)
+
+    def _check_house(self) -> None:
+        if self.total_pnl() >= self.limits.house_kill_loss:
+            self.halted = True
+
+    def update_marks(self, bid: float, ask: float) -> None:
+        """Re-mark all positions at new quotes"""
+        self.bid, self.ask = bid, ask
+        self._check_house()
+
+    def settle(self, price: float) -> None:
+        """Close every open position at the settlement price"""
+        for state in self._open:
+            pnl = state.position * price - state.cost
+            state.realized += pnl
+            self.realized += pnl
+            state.position = state.cost = 0.0
+        self._open.clear()
+        self.long_position = self.short_position = self.open_cost = 0.0
+        self._check_house()
+
+    def kill(self, client: Optional[Hashable] = None) -> None:
+        """Block one client, or halt all trading when no client is given"""
+        if client is None:
+            self.halted = True
+        else:
+            self._client(client).killed = True
+
+    def reset(self, client: Optional[Hashable] = None) -> None:
+        """Lift a client block, or the global halt when no client is given"""
+        if client is None:
+            self.halted = False
+        elif client in self.clients:
+            self.clients[client].killed = False
+
+    def pack_state(self) -> bytes:
+        """Serialize limits, marks, aggregates, the halt flag and every client (int or str keys)"""
+        limits = self.limits
+        parts = [_LIMITS.pack(limits.max_position, limits.max_notional, limits.max_loss,
+                              limits.max_total_position, limits.max_total_notional,
+                              limits.client_kill_loss, limits.house_kill_loss),
+                 _ENGINE.pack(self.bid, self.ask, self.long_position, self.short_position,
+                              self.open_cost, self.realized, self.halted, len(self.clients))]
+        for client, state in self.clients.items():
+            parts += [_pack_key(client), _CLIENT.pack(state.position, state.cost, state.realized, state.killed)]
+        return b"".join(parts)
+
+    def unpack_state(self, data: bytes, offset: int = 0) -> int:
+        """Restore state written by pack_state and return the offset after it"""
+        self.limits = RiskLimits(*_LIMITS.unpack_from(data, offset))
+        offset += _LIMITS.size
+        (self.bid, self.ask, self.long_position, self.short_position,
+         self.open_cost, self.realized, self.halted, count) = _ENGINE.unpack_from(data, offset)
+        offset += _ENGINE.size
+        self.clients = {}
+        self._open = set()
+        for _ in range(count):
+            client, offset = _unpack_key(data, offset)
+            state = self.clients[client] = ClientRisk()
+            state.position, state.cost, state.realized, state.killed = _CLIENT.unpack_from(data, offset)
+            offset += _CLIENT.size
+            if state.position:
+                self._open.add(state)
+        return offset
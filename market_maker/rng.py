@@ -0,0 +1,148 @@
+"""
+Buffered random number service injected into games and market makers.
+
+Seeded services pre-draw large blocks of uniforms from a NumPy PCG64
+Generator, hand them out from a buffer and spawn independent, reproducible
+substreams. Unseeded services read the stdlib Mersenne Twister directly,
+which already draws in C, so games built without a seed never load NumPy.
+Either way a single draw is one C-level call, and hot paths take whole
+batches with take() or randints().
+"""
+from itertools import chain, islice, repeat, starmap
+from typing import Any, Iterator, List, Optional
+import operator
+import random as _random
+import struct
+
+_PCG64, _MT19937 = 0, 1
+_SOURCE = struct.Struct("<B")
+# PCG64 state and increment (128-bit each), cached uint32 flag and value
+_PCG64_STATE = struct.Struct("<16s16s?I")
+_MT19937_STATE = struct.Struct("<625I")
+_POSITION = struct.Struct("<II")  # block size, values used from the block
+
+
+class RandomService:
+    def __init__(self, seed: Any = None, block_size: int = 4096):
+        self._seed = seed
+        self._seed_sequence = None
+        self._generator = None  # NumPy Generator of a seeded service, built with the first block
+        self._mt: Optional[_random.Random] = _random.Random() if seed is None else None
+        self.block_size = block_size
+        self._block_state = None  # Source state the current block was drawn from
+        self._block: Iterator[float] = iter(())
+        self._start()
+
+    def _build(self) -> None:
+        # NumPy is only loaded by seeded services, once values or substreams are needed
+        import numpy as np
+
+        if self._seed_sequence is None:
+            seed = self._seed
+            self._seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._generator = np.random.Generator(np.random.PCG64(self._seed_sequence))
+
+    def spawn(self) -> "RandomService":
+        """Create an independent substream, e.g. one per game or table"""
+        if self._mt is not None:
+            return RandomService(None, self.block_size)
+        if self._generator is None:
+            self._build()
+        return RandomService(self._seed_sequence.spawn(1)[0], self.block_size)
+
+    def _generator_state(self) -> dict:
+        if self._generator is None:
+            self._build()
+        return self._generator.bit_generator.state
+
+    def _draw_block(self) -> List[float]:
+        if self._generator is None:
+            self._build()
+        return self._generator.random(self.block_size).tolist()
+
+    def _blocks(self, first: Optional[Iterator[float]] = None) -> Iterator[Iterator[float]]:
+        if first is not None:
+            yield first
+        while True:
+            self._block_state = self._generator_state()
+            self._block = iter(self._draw_block())
+            yield self._block
+
+    def _start(self, first: Optional[Iterator[float]] = None) -> None:
+        # random() draws a uniform float in [0, 1) with one C-level call
+        if self._mt is not None:
+            self._stream = starmap(self._mt.random, repeat(()))
+            self.random = self._mt.random
+        else:
+            self._stream = chain.from_iterable(self._blocks(first))
+            self.random = self._stream.__next__
+
+    def take(self, n: int) -> List[float]:
+        """n uniform floats in [0, 1) in one call"""
+        return list(islice(self._stream, n))
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """Random integer in [a, b], including both end points"""
+        return a + int(self.random() * (b - a + 1))
+
+    def randints(self, a: int, b: int, n: int) -> List[int]:
+        """n random integers in [a, b], drawn as one batch"""
+        span = b - a + 1
+        return [a + int(u * span) for u in self.take(n)]
+
+    def shuffle(self, x: List[Any]) -> None:
+        """Shuffle a list in place (Fisher-Yates)"""
+        for i, u in zip(range(len(x) - 1, 0, -1), self.take(len(x) - 1)):
+            j = int(u * (i + 1))
+            x[i], x[j] = x[j], x[i]
+
+    def pack_state(self) -> bytes:
+        """Serialize the generator state at the current block plus the values used from it"""
+        if self._mt is not None:
+            return (_SOURCE.pack(_MT19937) + _MT19937_STATE.pack(*self._mt.getstate()[1])
+                    + _POSITION.pack(self.block_size, 0))
+        if self._block_state is None:
+            state, used = self._generator_state(), 0
+        else:
+            state, used = self._block_state, self.block_size - operator.length_hint(self._block)
+        return (_SOURCE.pack(_PCG64)
+                + _PCG64_STATE.pack(state["state"]["state"].to_bytes(16, "little"),
+                                    state["state"]["inc"].to_bytes(16, "little"),
+                                    bool(state["has_uint32"]), state["uinteger"])
+                + _POSITION.pack(self.block_size, used))
+
+    def unpack_state(self, data: bytes, offset: int = 0) -> int:
+        """Restore state written by pack_state and return the offset after it"""
+        (source,) = _SOURCE.unpack_from(data, offset)
+        offset += _SOURCE.size
+        if source == _MT19937:
+            if self._mt is None:
+                self._mt = _random.Random()
+            self._mt.setstate((3, _MT19937_STATE.unpack_from(data, offset), None))
+            offset += _MT19937_STATE.size
+        elif source == _PCG64:
+            self._mt = None
+            if self._generator is None:
+                self._build()
+            state, inc, has_uint32, uinteger = _PCG64_STATE.unpack_from(data, offset)
+            self._generator.bit_generator.state = {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"), "inc": int.from_bytes(inc, "little")},
+                "has_uint32": int(has_uint32),
+                "uinteger": uinteger,
+            }
+            offset += _PCG64_STATE.size
+        else:
+            raise ValueError(f"Unknown random source {source}")
+        self.block_size, used = _POSITION.unpack_from(data, offset)
+        if self._mt is not None:
+            self._start()
+        else:
+            # Redraw the block the state was saved in and skip the values already used
+            self._block_state = self._generator_state()
+            self._block = iter(self._draw_block()[used:])
+            self._start(self._block)
+        return offset + _POSITION.size
@@ -0,0 +1,24 @@
+import struct
+from typing import Dict, List, Tuple
+
+_COUNT = struct.Struct("<H")
+_INDEXED_FLOAT = struct.Struct("<Bd")
+
+
+def pack_indexed_floats(values: Dict[str, float], keys: List[str]) -> bytes:
+    """Pack a float dict as (key index, value) pairs against a fixed key list"""
+    index = {key: i for i, key in enumerate(keys)}
+    return _COUNT.pack(len(values)) + b"".join(
+        _INDEXED_FLOAT.pack(index[key], value) for key, value in values.items())
+
+
+def unpack_indexed_floats(data: bytes, offset: int, keys: List[str]) -> Tuple[Dict[str, float], int]:
+    """Unpack a dict written by pack_indexed_floats, returning it and the next offset"""
+    (count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    values = {}
+    for _ in range(count):
+        key_index, value = _INDEXED_FLOAT.unpack_from(data, offset)
+        values[keys[key_index]] = value
+        offset += _INDEXED_FLOAT.size
+    return values, offset
@@ -0,0 +1,178 @@
+"""
+Tournaments where many players trade the same dice/poker/coin rounds and
+are ranked by PnL.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from .games.game import Game
+from .games.dice import DiceGame
+from .games.poker import PokerGame
+from .games.coin import CoinGame
+from .rng import RandomService
+
+# Rough update costs in units of one shifted slot: fixed cost of moving one
+# player, and cost per player of a full re-sort
+_MOVE_COST = 1500
+_SORT_COST = 6
+
+
+class Leaderboard:
+    """
+    Order-statistics view over player scores.
+
+    Scores are kept sorted alongside the owning player ids and each player's
+    slot, so rank, percentile and top-K queries are binary searches or slices.
+    An update moves each changed player to its new slot, shifting only the
+    players in between, and falls back to a full sort when many players changed.
+    """
+
+    def __init__(self, scores: np.ndarray):
+        self._scores = np.array(scores, dtype=float)
+        self._slot = np.empty(len(self._scores), dtype=np.intp)
+        self._rebuild()  # Sets _order (player ids, ascending score) and _sorted
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def update(self, players: np.ndarray, scores: np.ndarray) -> None:
+        """Set new scores for a set of distinct players"""
+        players = np.asarray(players, dtype=np.intp)
+        scores = np.asarray(scores, dtype=float)
+        if players.size == 0:
+            return
+        budget = _SORT_COST * len(self._scores) - _MOVE_COST * players.size
+        if budget < 0 or np.abs(np.searchsorted(self._sorted, scores) - self._slot[players]).sum() > budget:
+            # Many or far moves, a full sort is cheaper than moving each player
+            self._scores[players] = scores
+            self._rebuild()
+            return
+        for player, score in zip(players.tolist(), scores.tolist()):
+            self._move(player, score)
+
+    def _rebuild(self) -> None:
+        self._order = np.argsort(self._scores)
+        self._sorted = self._scores[self._order]
+        self._slot[self._order] = np.arange(len(self._scores))
+
+    def _move(self, player: int, score: float) -> None:
+        """Shift the players between a player's old and new slot by one"""
+        i = int(self._slot[player])
+        sorted_scores, order = self._sorted, self._order
+        if score >= sorted_scores[i]:
+            j = i + int(np.searchsorted(sorted_scores[i + 1:], score, side="right"))
+            sorted_scores[i:j] = sorted_scores[i + 1:j + 1]
+            order[i:j] = order[i + 1:j + 1]
+            lo, hi = i, j
+        else:
+            j = int(np.searchsorted(sorted_scores[:i], score, side="right"))
+            sorted_scores[j + 1:i + 1] = sorted_scores[j:i]
+            order[j + 1:i + 1] = order[j:i]
+            lo, hi = j, i
+        sorted_scores[j] = score
+        order[j] = player
+        self._slot[order[lo:hi + 1]] = np.arange(lo, hi + 1)
+        self._scores[player] = score
+
+    def score(self, player: int) -> float:
+        return float(self._scores[player])
+
+    def rank(self, player: int) -> int:
+        """1-based rank, tied players share the best rank"""
+        above = len(self._sorted) - np.searchsorted(self._sorted, self._scores[player], side="right")
+        return int(above) + 1
+
+    def percentile(self, player: int) -> float:
+        """Percentage of players scoring at or below this player"""
+        at_or_below = np.searchsorted(self._sorted, self._scores[player], side="right")
+        return 100.0 * at_or_below / len(self._sorted)
+
+    def score_at_percentile(self, percentile: float) -> float:
+        """Lowest score reaching the given percentile"""
+        index = int(np.ceil(percentile / 100.0 * len(self._sorted))) - 1
+        return float(self._sorted[min(max(index, 0), len(self._sorted) - 1)])
+
+    def top_k(self, k: int) -> List[Tuple[int, float]]:
+        """The k best (player, score) pairs, best first"""
+        players = self._order[::-1][:k]
+        return list(zip(players.tolist(), self._scores[players].tolist()))
+
+
+class Tournament:
+    """Runs shared game rounds for many players and ranks them by PnL"""
+
+    def __init__(self, num_players: int, initial_balance: float = 1000.0,
+                 games: Optional[Dict[str, Game]] = None, seed: Any = None):
+        if games is None:
+            rng = RandomService(seed)
+            games = {"dice": DiceGame(rng.spawn()), "poker": PokerGame(rng.spawn()), "coin": CoinGame(rng.spawn())}
+        self.games = games
+        self.initial_balance = initial_balance
+        self.balances = np.full(num_players, initial_balance, dtype=float)
+        self.leaderboard = Leaderboard(self.balances - initial_balance)
+        self.round_number = 0
+
+    @property
+    def num_players(self) -> int:
+        return len(self.balances)
+
+    def outcome_names(self, game_name: str) -> List[str]:
+        """Column order expected for a game's stakes matrix"""
+        return list(self.games[game_name].outcomes)
+
+    def _valid_stakes(self, game: Game, stakes: np.ndarray) -> np.ndarray:
+        in_limits = (stakes == 0) | ((stakes >= game.min_bet) & (stakes <= game.max_bet))
+        return in_limits.all(axis=1) & (stakes >= 0).all(axis=1)
+
+    def play_round(self, bets: Dict[str, np.ndarray],
+                   trades: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Settle one round of every game for all players.
+        bets maps a game name to a (num_players, num_outcomes) stakes matrix in
+        outcome_names order; trades holds signed market maker shares per player
+        (positive buys at the ask, negative sells at the bid). Players whose slip
+        breaks bet limits or exceeds their balance sit the round out.
+        """
+        n = self.num_players
+        bets = {name: np.asarray(stakes, dtype=float).reshape(n, -1) for name, stakes in bets.items()}
+        trades = np.zeros(n) if trades is None else np.asarray(trades, dtype=float)
+
+        accepted = np.ones(n, dtype=bool)
+        cost = np.zeros(n)
+        for name, stakes in bets.items():
+            accepted &= self._valid_stakes(self.games[name], stakes)
+            cost += stakes.sum(axis=1)
+        poker = self.games.get("poker")
+        if poker is not None:
+            bid, ask = poker.get_market_prices()
+            prices = np.where(trades > 0, ask, bid)
+            cost += np.abs(trades) * prices
+        accepted &= cost <= self.balances
+
+        active = accepted & ((cost > 0) | (trades != 0))
+        pnl = np.zeros(n)
+        results = {}
+        for name, game in self.games.items():
+            odds = np.array([game.current_odds[outcome] for outcome in game.outcomes])
+            results[name] = game.play_round()
+            if name in bets:
+                won = np.array([results[name]["outcomes"][outcome] for outcome in game.outcomes])
+                stakes = bets[name]
+                pnl += stakes @ (won * odds) - stakes.sum(axis=1)
+        if poker is not None and trades.any():
+            pnl += trades * (results["poker"]["sum"] - prices)
+
+        players = np.flatnonzero(active)
+        self.balances[players] += pnl[players]
+        self.leaderboard.update(players, self.balances[players] - self.initial_balance)
+        self.round_number += 1
+        results["accepted"] = accepted
+        return results
+
+    def rank(self, player: int) -> int:
+        return self.leaderboard.rank(player)
+
+    def percentile(self, player: int) -> float:
+        return self.leaderboard.percentile(player)
+
+    def top_k(self, k: int = 10) -> List[Tuple[int, float]]:
+        return self.leaderboard.top_k(k)
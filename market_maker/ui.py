@@ -5,18 +5,24 @@ from .games.dice import DiceGame
 from .games.poker import PokerGame
 from .games.coin import CoinGame
 from .market_maker import MarketMaker
+from .history import RoundHistory
+from .history_panel import HistoryPanel
+from .chart_panel import ChartPanel
+from .preview import SlipPreview
 
 class GameUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Market Making Trading Games")
-        self.root.geometry("400x800")  # Increased window size
+        self.root.geometry("700x1300")  # Room for the history and chart panels
         
         # Initialize all games
         self.dice_game = DiceGame()
         self.poker_game = PokerGame()
         self.coin_game = CoinGame()
         self.player_balance = 1000.0
+        self.round_number = 0
+        self.game_pnl = {"dice": 0.0, "poker": 0.0, "coin": 0.0}  # Cumulative PnL per game
         
         # Set initial balance for all games
         self.dice_game.set_balance(self.player_balance)
@@ -57,6 +63,18 @@ class GameUI:
         submit_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=10)
         ttk.Button(submit_frame, text="Submit", 
                   command=self.submit_all_games).grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.preview_label = ttk.Label(submit_frame, text="", justify=tk.LEFT)
+        self.preview_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.setup_preview()
+
+        # Round history for all games
+        self.history = RoundHistory({"dice": self.dice_game, "poker": self.poker_game, "coin": self.coin_game})
+        self.history_panel = HistoryPanel(self.main_frame, self.history)
+        self.history_panel.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=5)
+
+        # Live chart of balance, PnL and poker quotes
+        self.chart_panel = ChartPanel(self.main_frame)
+        self.chart_panel.grid(row=6, column=0, sticky=(tk.W, tk.E), pady=5)
 
     def setup_dice_section(self):
         # Create a frame for dice game that will contain both betting and results
@@ -202,6 +220,51 @@ class GameUI:
         self.coin_results_label = ttk.Label(coin_results_frame, text="", justify=tk.LEFT)
         self.coin_results_label.grid(row=1, column=0, sticky=tk.W)
 
+    def setup_preview(self):
+        """Show live what-if statistics for the slip being typed"""
+        self.preview = SlipPreview({"dice": self.dice_game, "poker": self.poker_game, "coin": self.coin_game})
+        self.bet_entries = {"dice": self.dice_bet_amounts, "poker": self.poker_bet_amounts, "coin": self.coin_bet_amounts}
+        self._preview_job = None
+        self._preview_changes = set()  # (game, outcome) entries edited since the last preview
+        
+        for game_type, bet_dict in self.bet_entries.items():
+            for outcome, bet_entry in bet_dict.items():
+                bet_entry.bind("<KeyRelease>", lambda event, key=(game_type, outcome): self.schedule_preview(key))
+        self.poker_trade_amount.bind("<KeyRelease>", lambda event: self.schedule_preview(("poker", "trade")))
+        self.poker_trade_type.trace_add("write", lambda *args: self.schedule_preview(("poker", "trade")))
+        self.update_preview()
+
+    def schedule_preview(self, key, delay_ms=150):
+        """Debounce keystrokes so the preview only updates once typing pauses"""
+        self._preview_changes.add(key)
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(delay_ms, self.update_preview)
+
+    def _entry_amount(self, entry):
+        try:
+            return max(float(entry.get() or 0), 0.0)
+        except ValueError:
+            return 0.0
+
+    def update_preview(self):
+        self._preview_job = None
+        for game_type, decision in self._preview_changes:
+            if decision == "trade":
+                shares = self._entry_amount(self.poker_trade_amount)
+                is_buy = self.poker_trade_type.get() == "buy"
+                self.preview.set_stake("poker", "buy", shares if is_buy else 0.0)
+                self.preview.set_stake("poker", "sell", 0.0 if is_buy else shares)
+            else:
+                self.preview.set_stake(game_type, decision, self._entry_amount(self.bet_entries[game_type][decision]))
+        self._preview_changes.clear()
+        
+        stats = self.preview.summary()
+        self.preview_label.config(text=f"Expected PnL: ${stats['expected_pnl']:+.2f}   "
+                                       f"Win: {stats['win_probability']:.1%}   "
+                                       f"Worst: ${stats['worst_case']:+.2f}   "
+                                       f"Std: ${stats['std']:.2f}")
+
     def update_odds_display(self, game_type):
         if game_type == "dice":
             for outcome, odds in self.dice_game.current_odds.items():
@@ -269,6 +332,9 @@ class GameUI:
                 messagebox.showerror("Error", "Insufficient balance for all bets")
                 return
             
+            # Quotes the poker trade was made at, for the chart
+            quote_bid, quote_ask = self.poker_game.get_market_prices()
+            
             # Play all games and update results
             game_results = {
                 "dice": self.dice_game.play_round(),
@@ -293,6 +359,15 @@ class GameUI:
             # Now sync the balances to prepare for next round
             self.sync_game_balances()
             
+            # Record the round in the history panel
+            self.round_number += 1
+            for game_type, pnl in [("dice", dice_pnl), ("poker", poker_pnl), ("coin", coin_pnl)]:
+                self.history.record(self.round_number, game_type, game_results[game_type], pnl)
+                self.game_pnl[game_type] += pnl
+            self.history_panel.refresh()
+            self.chart_panel.push([self.player_balance, self.game_pnl["dice"], self.game_pnl["poker"],
+                                   self.game_pnl["coin"], quote_bid, quote_ask, game_results["poker"]["sum"]])
+            
             # Update result summary
             result_summary = "Game Results:\n"
             if dice_pnl != 0:
@@ -329,6 +404,11 @@ class GameUI:
                     bet_entry.delete(0, tk.END)  # Clear current value
                     bet_entry.insert(0, "0")     # Set to "0"
             
+            # Preview the remaining slip against the new odds and quotes
+            self.preview.clear()
+            self._preview_changes.add(("poker", "trade"))
+            self.update_preview()
+            
         except ValueError:
             messagebox.showerror("Error", "Please enter valid amounts")
 